@@ -70,6 +70,19 @@ export async function GET(request: NextRequest) {
 
     const duration = Date.now() - startTime;
 
+    // Let SDKs revalidate unchanged evaluations without re-downloading them
+    const etag = await computeEtag(results);
+    if (request.headers.get('if-none-match') === etag) {
+      return new Response(null, {
+        status: 304,
+        headers: {
+          'ETag': etag,
+          'X-Evaluation-Time': duration.toString(),
+          'Cache-Control': 'no-cache'
+        }
+      });
+    }
+
     return new Response(
       JSON.stringify({
         flags: results,
@@ -81,6 +94,7 @@ export async function GET(request: NextRequest) {
         status: 200,
         headers: {
           'Content-Type': 'application/json',
+          'ETag': etag,
           'X-Evaluation-Time': duration.toString(),
           'Cache-Control': 'no-cache'
         }
@@ -95,6 +109,15 @@ export async function GET(request: NextRequest) {
   }
 }
 
+async function computeEtag(results: FlagEvaluationResult[]): Promise<string> {
+  const data = new TextEncoder().encode(JSON.stringify(results));
+  const digest = await crypto.subtle.digest('SHA-256', data);
+  const hex = Array.from(new Uint8Array(digest).slice(0, 8))
+    .map((byte) => byte.toString(16).padStart(2, '0'))
+    .join('');
+  return `"${hex}"`;
+}
+
 function evaluateFlag(
   flag: Flag,
   userKey: string,
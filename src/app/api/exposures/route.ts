@@ -1,9 +1,61 @@
 import { NextRequest } from 'next/server';
 import { prisma } from '@/lib/database';
 
+// Upper bound on exposures per batched POST (the Python SDK sends at most 32)
+const MAX_EXPOSURE_BATCH = 100;
+
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
+
+    // SDKs may flush several queued exposures in one request
+    if (Array.isArray(body)) {
+      if (body.length > MAX_EXPOSURE_BATCH) {
+        return Response.json({
+          error: `Too many exposures: at most ${MAX_EXPOSURE_BATCH} per request`
+        }, { status: 413 });
+      }
+
+      // Validate each event on its own so one bad event does not reject the batch
+      const rejected: { index: number; error: string }[] = [];
+      const complete: { index: number; event: any }[] = [];
+      body.forEach((event: any, index: number) => {
+        if (!event || !event.userKey || !event.flagKey || !event.variant) {
+          rejected.push({ index, error: 'Missing required fields: userKey, flagKey, variant' });
+        } else {
+          complete.push({ index, event });
+        }
+      });
+
+      // Exposures reference flags by key, so drop events for unknown flags
+      const knownFlags = await prisma.flag.findMany({
+        where: { key: { in: complete.map(({ event }) => event.flagKey) } },
+        select: { key: true }
+      });
+      const knownKeys = new Set(knownFlags.map((flag) => flag.key));
+
+      const accepted = complete.filter(({ index, event }) => {
+        if (knownKeys.has(event.flagKey)) {
+          return true;
+        }
+        rejected.push({ index, error: `Unknown flag: ${event.flagKey}` });
+        return false;
+      });
+      const data = accepted.map(({ event }) => ({
+        userKey: event.userKey,
+        flagKey: event.flagKey,
+        variant: event.variant,
+        attributesJson: event.attributes || {}
+      }));
+
+      if (data.length === 0 && body.length > 0) {
+        return Response.json({ error: 'No valid exposures', rejected }, { status: 400 });
+      }
+
+      const { count } = await prisma.exposure.createMany({ data });
+
+      return Response.json({ count, rejected }, { status: 201 });
+    }
     
     const {
       userKey,
@@ -2,11 +2,52 @@ import asyncio
 import json
 import time
 import logging
-from typing import Dict, Any, Optional, List
-import aiohttp
-import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
+import httpx
+import msgspec
+from importlib.util import find_spec
+from urllib.parse import quote_plus, urlencode
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = find_spec('h2') is not None
+
+# How long cache misses are collected before one batched fetch (seconds)
+_BATCH_WINDOW = 0.005
+
+# Exposure events are queued and flushed by background workers in batches
+_EXPOSURE_QUEUE_SIZE = 1024
+_EXPOSURE_BATCH_SIZE = 32
+_EXPOSURE_FLUSH_INTERVAL = 0.1
+_EXPOSURE_WORKERS = 2
+
+# ETags are only kept for a handful of recurring key sets (refresh, get_flags)
+_ETAG_CACHE_SIZE = 64
+
+_logging_configured = False
+
+def _configure_logging() -> None:
+    """Install the default log handler once per process"""
+    global _logging_configured
+    if not _logging_configured:
+        logging.basicConfig(level=logging.INFO)
+        _logging_configured = True
 
 class UserAttributes:
+    __slots__ = ('user_id', 'country', 'device_type', 'user_agent', 'custom_properties')
+    # Known attribute names; anything else is stored as a custom property
+    _FIELDS = frozenset(__slots__)
+
     def __init__(
         self,
         user_id: str,
@@ -30,36 +71,48 @@ class UserAttributes:
             'customProperties': self.custom_properties
         }
 
-class FlagEvaluationResult:
-    def __init__(
-        self,
-        flag_key: str,
-        variant: str,
-        value: Any,
-        is_active: bool,
-        reason: str
-    ):
-        self.flag_key = flag_key
-        self.variant = variant
-        self.value = value
-        self.is_active = is_active
-        self.reason = reason
+class FlagEvaluationResult(msgspec.Struct, rename='camel'):
+    # Field names map to the API's camelCase keys (flagKey, isActive, ...)
+    flag_key: str
+    variant: str
+    value: Any
+    is_active: bool
+    reason: str
 
     def __repr__(self) -> str:
         return f"FlagEvaluationResult(flag_key='{self.flag_key}', variant='{self.variant}', value={self.value}, is_active={self.is_active})"
 
+class _FlagsResponse(msgspec.Struct):
+    flags: List[FlagEvaluationResult] = msgspec.field(default_factory=list)
+
+# Decodes /api/edge/flags bodies straight into FlagEvaluationResult structs
+_decode_flags_response = msgspec.json.Decoder(_FlagsResponse).decode
+
 class FlagshipConfig:
+    __slots__ = (
+        'api_url', 'flags_url', 'exposures_url', 'refresh_interval',
+        'enable_debug_logs', 'timeout', 'pool_size', 'keepalive', 'cache_max'
+    )
+
     def __init__(
         self,
         api_url: str,
         refresh_interval: int = 60,
         enable_debug_logs: bool = False,
-        timeout: int = 5
+        timeout: int = 5,
+        pool_size: int = 100,
+        keepalive: int = 60,
+        cache_max: int = 10000
     ):
         self.api_url = api_url.rstrip('/')
+        self.flags_url = self.api_url + '/api/edge/flags'
+        self.exposures_url = self.api_url + '/api/exposures'
         self.refresh_interval = refresh_interval
         self.enable_debug_logs = enable_debug_logs
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.keepalive = keepalive
+        self.cache_max = cache_max
 
 class FlagshipClient:
     def __init__(
@@ -71,13 +124,29 @@ class FlagshipClient:
         self.user_key = user_key
         self.user_attributes = user_attributes
         self.config = config
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.cache: 'OrderedDict[str, Tuple[FlagEvaluationResult, int]]' = OrderedDict()
+        self.session: Optional[httpx.AsyncClient] = None
         self.refresh_task: Optional[asyncio.Task] = None
+        # Wakes the refresh loop: set by stop() and after every refresh()
+        self._wake_event: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._batch_event: Optional[asyncio.Event] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_flush: Optional[asyncio.Future] = None
+        self._base_query = ''
+        self._attributes_dict: Optional[Dict[str, Any]] = None
+        self._attributes_hash = ''
+        # (attributes hash, requested keys) -> (ETag, flag keys it covered)
+        self._etags: Dict[Tuple[str, Tuple[str, ...]], Tuple[str, FrozenSet[str]]] = {}
+        self._exposure_queue: Optional[asyncio.Queue] = None
+        self._exposure_workers: List[asyncio.Task] = []
+        self._base_headers: Dict[str, str] = {}
         
         # Setup logging
         if config.enable_debug_logs:
-            logging.basicConfig(level=logging.INFO)
+            _configure_logging()
         self.logger = logging.getLogger('flagship')
 
     async def __aenter__(self):
@@ -91,27 +160,80 @@ class FlagshipClient:
 
     async def start(self):
         """Initialize the client"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        # HTTP/2 multiplexes concurrent requests over pooled keep-alive connections;
+        # without h2 installed the client falls back to HTTP/1.1
+        self.session = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.config.pool_size,
+                max_keepalive_connections=self.config.pool_size,
+                keepalive_expiry=self.config.keepalive
+            ),
+            timeout=self.config.timeout
         )
+        self._build_request_state()
         
+        self._batch_event = asyncio.Event()
+        self._batch_task = asyncio.create_task(self._batch_fetch_loop())
+
+        self._exposure_queue = asyncio.Queue(maxsize=_EXPOSURE_QUEUE_SIZE)
+        self._exposure_workers = [
+            asyncio.create_task(self._exposure_worker())
+            for _ in range(_EXPOSURE_WORKERS)
+        ]
+
         if self.config.refresh_interval > 0:
+            self._stopping = False
+            self._wake_event = asyncio.Event()
             self.refresh_task = asyncio.create_task(self._periodic_refresh())
             self.log("Started periodic refresh")
 
     async def stop(self):
         """Stop the client and cleanup resources"""
         if self.refresh_task:
-            self.refresh_task.cancel()
+            # Wakes the refresh loop immediately; it exits on its own
+            self._stopping = True
+            self._wake_event.set()
+            await self.refresh_task
+            self.refresh_task = None
+
+        if self._batch_task:
+            self._batch_task.cancel()
             try:
-                await self.refresh_task
+                await self._batch_task
             except asyncio.CancelledError:
                 pass
+            self._batch_task = None
+
+        # Let a batch already in flight finish before the session closes
+        if self._batch_flush is not None and not self._batch_flush.done():
+            await asyncio.wait({self._batch_flush}, timeout=self.config.timeout)
+        self._batch_flush = None
+
+        # Misses that never made it into a batch get the default, as a failed fetch would
+        for flag_key, future in self._pending.items():
+            if not future.done():
+                future.set_result(self._resolve_flag(flag_key, {}))
+        self._pending.clear()
+
+        if self._exposure_queue is not None:
+            # Give queued exposures a chance to flush before the session closes
+            try:
+                await asyncio.wait_for(self._exposure_queue.join(), timeout=self.config.timeout)
+            except asyncio.TimeoutError:
+                self.log("Dropped unsent exposures on shutdown", level='error')
+
+            for worker in self._exposure_workers:
+                worker.cancel()
+            await asyncio.gather(*self._exposure_workers, return_exceptions=True)
+            self._exposure_workers = []
+            self._exposure_queue = None
 
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
         
         self.cache.clear()
+        self._etags.clear()
         self.log("Client stopped")
 
     async def get_flag(self, flag_key: str) -> FlagEvaluationResult:
@@ -119,58 +241,83 @@ class FlagshipClient:
         # Check cache first
         cached = self._get_cached_flag(flag_key)
         if cached:
-            self.log(f"Cache hit for flag: {flag_key}")
+            self.log("Cache hit for flag: %s", flag_key)
             return cached
 
-        # Fetch from API
-        self.log(f"Cache miss for flag: {flag_key}, fetching from API")
-        return await self._fetch_and_cache_flag(flag_key)
+        # Join an in-flight fetch for the same key instead of issuing another
+        fetch = self._inflight.get(flag_key)
+        if fetch is None:
+            self.log("Cache miss for flag: %s, fetching from API", flag_key)
+            fetch = asyncio.ensure_future(self._fetch_and_cache_flag(flag_key))
+            self._inflight[flag_key] = fetch
+            fetch.add_done_callback(lambda _: self._inflight.pop(flag_key, None))
+
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(fetch)
 
     async def get_flags(self, flag_keys: Optional[List[str]] = None) -> Dict[str, FlagEvaluationResult]:
         """Get multiple flags at once"""
-        params = {
-            'userKey': self.user_key,
-            'country': self.user_attributes.country or '',
-            'deviceType': self.user_attributes.device_type or '',
-            'customProperties': json.dumps(self.user_attributes.custom_properties)
-        }
-
-        if flag_keys:
-            params['flagKeys'] = ','.join(flag_keys)
-
-        headers = {}
-        if self.user_attributes.user_agent:
-            headers['User-Agent'] = self.user_attributes.user_agent
+        return await self._fetch_flags(flag_keys, revalidate=True)
 
+    async def _fetch_flags(
+        self,
+        flag_keys: Optional[List[str]],
+        revalidate: bool
+    ) -> Dict[str, FlagEvaluationResult]:
+        """Fetch flags, using ETags only for key sets that recur (revalidate=True)"""
         try:
             if not self.session:
                 raise RuntimeError("Client not started. Call start() first or use as async context manager.")
 
-            url = f"{self.config.api_url}/api/edge/flags"
-            async with self.session.get(url, params=params, headers=headers) as response:
-                if response.status != 200:
-                    raise aiohttp.ClientError(f"HTTP {response.status}: {response.reason}")
-                
-                data = await response.json()
-                results = {}
-
-                # Cache and return results
-                for flag_data in data.get('flags', []):
-                    flag_result = FlagEvaluationResult(
-                        flag_key=flag_data['flagKey'],
-                        variant=flag_data['variant'],
-                        value=flag_data['value'],
-                        is_active=flag_data['isActive'],
-                        reason=flag_data['reason']
-                    )
-                    self._cache_flag(flag_data['flagKey'], flag_result)
-                    results[flag_data['flagKey']] = flag_result
-
-                self.log(f"Fetched {len(results)} flags from API")
-                return results
+            # Sorted so the same flag set always maps to the same query and ETag
+            flag_keys = tuple(sorted(flag_keys)) if flag_keys else ()
+
+            # Query string is pre-encoded so no params are encoded per request
+            url = self.config.flags_url + '?' + self._base_query
+            if flag_keys:
+                url += '&flagKeys=' + quote_plus(','.join(flag_keys))
+
+            etag_key = (self._attributes_hash, flag_keys)
+            known = self._etags.get(etag_key) if revalidate else None
+            # Only revalidate when every flag the ETag covered is still cached
+            if known and not all(flag_key in self.cache for flag_key in known[1]):
+                known = None
+
+            headers = self._base_headers
+            if known:
+                headers = {**headers, 'If-None-Match': known[0]}
+
+            response = await self.session.get(url, headers=headers)
+            if response.status_code == 304 and known:
+                results = self._revalidate_cached(known[1])
+                if results is not None:
+                    self.log("Flags not modified, reused %d cached flags", len(results))
+                    return results
+
+                # Flags were dropped while the request was in flight; fetch the full payload
+                response = await self.session.get(url, headers=self._base_headers)
+
+            if response.status_code != 200:
+                raise httpx.HTTPError(f"HTTP {response.status_code}: {response.reason_phrase}")
+
+            parsed = _decode_flags_response(response.content)
+            results = {}
+
+            # Cache and return results; a local avoids repeated lookups per flag
+            cache_flag = self._cache_flag
+            for flag_result in parsed.flags:
+                cache_flag(flag_result.flag_key, flag_result)
+                results[flag_result.flag_key] = flag_result
+
+            etag = response.headers.get('ETag')
+            if revalidate and etag:
+                self._remember_etag(etag_key, etag, frozenset(results))
+
+            self.log("Fetched %d flags from API", len(results))
+            return results
 
         except Exception as error:
-            self.log(f"Error fetching flags: {error}", level='error')
+            self.log("Error fetching flags: %s", error, level='error')
             return {}
 
     async def is_enabled(self, flag_key: str) -> bool:
@@ -186,58 +333,178 @@ class FlagshipClient:
     async def log_exposure(self, flag_key: str, variant: str) -> None:
         """Log an exposure event"""
         try:
-            if not self.session:
-                raise RuntimeError("Client not started")
-
-            payload = {
+            await self._post_exposures({
                 'userKey': self.user_key,
                 'flagKey': flag_key,
                 'variant': variant,
-                'attributes': self.user_attributes.to_dict()
-            }
+                'attributes': self._attributes_dict
+            })
+            self.log("Logged exposure: %s = %s", flag_key, variant)
 
-            url = f"{self.config.api_url}/api/exposures"
-            async with self.session.post(url, json=payload) as response:
-                if response.status not in [200, 201]:
-                    raise aiohttp.ClientError(f"HTTP {response.status}")
+        except Exception as error:
+            self.log("Error logging exposure: %s", error, level='error')
 
-            self.log(f"Logged exposure: {flag_key} = {variant}")
+    async def _post_exposures(self, payload: Any) -> None:
+        """POST one exposure event or a list of them"""
+        if not self.session:
+            raise RuntimeError("Client not started")
 
-        except Exception as error:
-            self.log(f"Error logging exposure: {error}", level='error')
+        body = _json_dumps(payload)
+        headers = {'Content-Type': 'application/json'}
+        response = await self.session.post(self.config.exposures_url, content=body, headers=headers)
+        if response.status_code not in [200, 201]:
+            raise httpx.HTTPError(f"HTTP {response.status_code}")
+
+    def _queue_exposure(self, flag_key: str, variant: str) -> None:
+        """Hand an exposure to the background workers without blocking"""
+        if self._exposure_queue is None:
+            return
+
+        event = {
+            'userKey': self.user_key,
+            'flagKey': flag_key,
+            'variant': variant,
+            'attributes': self._attributes_dict
+        }
+        try:
+            self._exposure_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.log("Exposure queue full, dropped exposure: %s", flag_key, level='error')
+
+    async def _exposure_worker(self) -> None:
+        """Background task that flushes queued exposures in batches"""
+        queue = self._exposure_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _EXPOSURE_FLUSH_INTERVAL
+            while len(batch) < _EXPOSURE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._post_exposures(batch)
+                self.log("Logged %d exposures", len(batch))
+            except Exception as error:
+                self.log("Error logging exposures: %s", error, level='error')
+            finally:
+                for _ in batch:
+                    queue.task_done()
 
     def update_user_attributes(self, attributes: Dict[str, Any]) -> None:
         """Update user attributes"""
         for key, value in attributes.items():
-            if hasattr(self.user_attributes, key):
+            if key in UserAttributes._FIELDS:
                 setattr(self.user_attributes, key, value)
             else:
                 self.user_attributes.custom_properties[key] = value
+        self._build_request_state()
         
         # Clear cache since user attributes changed
         self.cache.clear()
         self.log("User attributes updated, cache cleared")
 
+    def _build_request_state(self) -> None:
+        """Precompute the per-user query string, headers, exposure attributes and ETag hash"""
+        # Imported here so short-lived processes that never start a client skip it
+        import hashlib
+
+        attrs = self.user_attributes
+        # Copy custom properties: update_user_attributes mutates them in place,
+        # and queued exposures must keep the attributes they were evaluated with
+        self._attributes_dict = {
+            **attrs.to_dict(),
+            'customProperties': dict(attrs.custom_properties)
+        }
+        # Identifies this set of attributes in the ETag map
+        self._attributes_hash = hashlib.blake2b(
+            _json_dumps(self._attributes_dict), digest_size=8
+        ).hexdigest()
+        self._base_query = urlencode({
+            'userKey': self.user_key,
+            'country': attrs.country or '',
+            'deviceType': attrs.device_type or '',
+            'customProperties': _json_dumps(attrs.custom_properties).decode()
+        }, quote_via=quote_plus)
+
+        self._base_headers = {}
+        if attrs.user_agent:
+            self._base_headers['User-Agent'] = attrs.user_agent
+
     async def refresh(self) -> None:
         """Manually refresh all cached flags"""
+        # Expired entries no ETag covers are dead weight; don't refetch them
+        now = time.monotonic_ns()
+        for flag_key, (_, expiry) in list(self.cache.items()):
+            if now > expiry and not self._etag_covers(flag_key):
+                del self.cache[flag_key]
+
+        # Keep serving the current entries while the refetch is in flight;
+        # get_flags overwrites each key as results arrive
         cached_keys = list(self.cache.keys())
-        self.cache.clear()
-        
         if cached_keys:
             await self.get_flags(cached_keys)
+
+        # Restart the periodic refresh interval from this refresh
+        if self._wake_event is not None:
+            self._wake_event.set()
         
         self.log("Manual refresh completed")
 
     async def _fetch_and_cache_flag(self, flag_key: str) -> FlagEvaluationResult:
-        """Fetch a single flag and cache it"""
-        flags = await self.get_flags([flag_key])
-        
+        """Fetch a single flag through the batcher and cache it"""
+        if self._batch_task is None:
+            flags = await self._fetch_flags([flag_key], revalidate=False)
+            return self._resolve_flag(flag_key, flags)
+
+        future = self._pending.get(flag_key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[flag_key] = future
+            self._batch_event.set()
+
+        return await future
+
+    async def _batch_fetch_loop(self) -> None:
+        """Background task that coalesces single-flag misses into one request"""
+        while True:
+            await self._batch_event.wait()
+            await asyncio.sleep(_BATCH_WINDOW)
+            self._batch_event.clear()
+
+            # Shielded so stop() cancelling the loop never strands a batch mid-fetch
+            self._batch_flush = asyncio.ensure_future(self._flush_pending())
+            await asyncio.shield(self._batch_flush)
+
+    async def _flush_pending(self) -> None:
+        """Fetch every pending flag in one request and resolve their futures"""
+        pending, self._pending = self._pending, {}
+        try:
+            # Batches are arbitrary key sets that rarely repeat, so skip ETags
+            flags = await self._fetch_flags(list(pending), revalidate=False)
+            for flag_key, future in pending.items():
+                if not future.done():
+                    future.set_result(self._resolve_flag(flag_key, flags))
+        except Exception as error:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    def _resolve_flag(
+        self,
+        flag_key: str,
+        flags: Dict[str, FlagEvaluationResult]
+    ) -> FlagEvaluationResult:
+        """Pick a flag out of a fetch result, falling back to the default"""
         if flag_key in flags:
             # Auto-log exposure for active flags
             if flags[flag_key].is_active:
-                asyncio.create_task(
-                    self.log_exposure(flag_key, flags[flag_key].variant)
-                )
+                self._queue_exposure(flag_key, flags[flag_key].variant)
             return flags[flag_key]
 
         # Return default if flag not found
@@ -252,45 +519,93 @@ class FlagshipClient:
         self._cache_flag(flag_key, default_result)
         return default_result
 
+    def _revalidate_cached(self, flag_keys: FrozenSet[str]) -> Optional[Dict[str, FlagEvaluationResult]]:
+        """Re-cache flags the server reported unchanged, or None if any are gone"""
+        results = {}
+        for flag_key in flag_keys:
+            # Expired entries are still valid here: the server just confirmed them
+            entry = self.cache.get(flag_key)
+            if entry is None:
+                return None
+            results[flag_key] = entry[0]
+
+        for flag_key, result in results.items():
+            self._cache_flag(flag_key, result)
+        return results
+
+    def _remember_etag(
+        self,
+        etag_key: Tuple[str, Tuple[str, ...]],
+        etag: str,
+        flag_keys: FrozenSet[str]
+    ) -> None:
+        """Store an ETag for a request, dropping the oldest once the map is full"""
+        self._etags.pop(etag_key, None)
+        if self._etags and len(self._etags) >= _ETAG_CACHE_SIZE:
+            self._etags.pop(next(iter(self._etags)))
+        self._etags[etag_key] = (etag, flag_keys)
+
+    def _etag_covers(self, flag_key: str) -> bool:
+        """Whether a stored ETag can still revalidate this flag"""
+        return any(flag_key in flag_keys for _, flag_keys in self._etags.values())
+
     def _get_cached_flag(self, flag_key: str) -> Optional[FlagEvaluationResult]:
         """Get flag from cache if not expired"""
-        cached = self.cache.get(flag_key)
-        if not cached:
+        entry = self.cache.get(flag_key)
+        if entry is None:
             return None
 
-        now = time.time()
-        if now > cached['timestamp'] + cached['ttl']:
-            del self.cache[flag_key]
+        result, expiry = entry
+        if time.monotonic_ns() > expiry:
+            # Keep expired entries a stored ETag covers so the next fetch
+            # can revalidate them with If-None-Match
+            if not self._etag_covers(flag_key):
+                del self.cache[flag_key]
             return None
 
-        return cached['result']
+        self.cache.move_to_end(flag_key)
+        return result
 
     def _cache_flag(self, flag_key: str, result: FlagEvaluationResult) -> None:
         """Cache a flag result"""
-        self.cache[flag_key] = {
-            'result': result,
-            'timestamp': time.time(),
-            'ttl': 300  # 5 minutes
-        }
+        # Store the absolute expiry in ns so lookups need a single int compare
+        self.cache[flag_key] = (result, time.monotonic_ns() + 300_000_000_000)  # 5 minutes
+        self.cache.move_to_end(flag_key)
+
+        # Evict least recently used flags once the cache is full
+        while len(self.cache) > self.config.cache_max:
+            self.cache.popitem(last=False)
 
     async def _periodic_refresh(self) -> None:
         """Background task for periodic refresh"""
         while True:
+            self._wake_event.clear()
             try:
-                await asyncio.sleep(self.config.refresh_interval)
-                await self.refresh()
-            except asyncio.CancelledError:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=self.config.refresh_interval)
+            except asyncio.TimeoutError:
+                try:
+                    await self.refresh()
+                except Exception as error:
+                    self.log("Periodic refresh failed: %s", error, level='error')
+                continue
+
+            if self._stopping:
                 break
-            except Exception as error:
-                self.log(f"Periodic refresh failed: {error}", level='error')
+            # A manual refresh just ran; restart the interval from now
 
-    def log(self, message: str, level: str = 'info') -> None:
-        """Log a message if debug logging is enabled"""
-        if self.config.enable_debug_logs:
-            if level == 'error':
-                self.logger.error(f"[Flagship] {message}")
-            else:
-                self.logger.info(f"[Flagship] {message}")
+    def log(self, message: str, *args: Any, level: str = 'info') -> None:
+        """Log a message if debug logging is enabled
+
+        Arguments are %-formatted by the logger, so nothing is formatted
+        when debug logging is off.
+        """
+        if not self.config.enable_debug_logs:
+            return
+
+        if level == 'error':
+            self.logger.error("[Flagship] " + message, *args)
+        else:
+            self.logger.info("[Flagship] " + message, *args)
 
 # Factory function for easier usage
 def create_flagship_client(
@@ -301,6 +616,21 @@ def create_flagship_client(
     """Create a new Flagship client instance"""
     return FlagshipClient(user_key, user_attributes, config)
 
+def install_uvloop() -> bool:
+    """Use uvloop for new event loops if it is installed
+
+    Must be called before the event loop is created (e.g. before
+    asyncio.run), since a running loop cannot be swapped out from
+    inside the client. Returns True if uvloop was installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 # Example usage
 async def example_usage():
     """Example of how to use the Flagship Python SDK"""
@@ -335,5 +665,6 @@ async def example_usage():
             print(f"{flag_key}: {result}")
 
 if __name__ == '__main__':
-    # Run the example
+    # Run the example, on uvloop when available
+    install_uvloop()
     asyncio.run(example_usage())
\ No newline at end of file